@@ -6,6 +6,7 @@ from ..service.platform import get_platform
 from ..models.config import PLATFORM_TYPES
 from ..util.pprint import pprint_size, pprint_dict
 from ..util.paths import Paths
+from ..util.process import read_pid_file
 
 
 @click.group()
@@ -257,12 +258,11 @@ def logs():
         platform.stream_logs(None)
     else:
         # For container platforms, get server_id from PID file
-        pid_file = platform.storage.pid_file_path()
-        if not pid_file.exists():
+        server_id = read_pid_file(platform.storage.pid_file_path())
+        if server_id is None:
             click.echo("Server not running")
             return
 
-        server_id = pid_file.read_text().strip()
         platform.stream_logs(server_id)
 
 
@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .. import __version__
 
@@ -10,6 +10,8 @@ from .. import __version__
 class ClientInfo(BaseModel):
     """Information that the client knows about the system."""
 
+    model_config = ConfigDict(frozen=True, validate_assignment=False, extra="ignore")
+
     client_version: str = Field(default=__version__, description="Client version")
     runtime_type: str = Field(description="Runtime backend type (native, podman)")
     server_status: str = Field(description="Server running status")
@@ -20,6 +22,8 @@ class ClientInfo(BaseModel):
 class ServerInfo(BaseModel):
     """Information reported by the server (extensible for future features)."""
 
+    model_config = ConfigDict(frozen=True, validate_assignment=False, extra="ignore")
+
     server_version: Optional[str] = Field(default=None, description="Server version")
     server_pid: Optional[int] = Field(default=None, description="Server internal process ID")
     veilid_status: Optional[str] = Field(default=None, description="Veilid connection status")
@@ -30,5 +34,7 @@ class ServerInfo(BaseModel):
 class InfoResponse(BaseModel):
     """Combined client and server information response."""
 
+    model_config = ConfigDict(frozen=True, validate_assignment=False, extra="ignore")
+
     client: ClientInfo = Field(description="Client-side information")
     server: ServerInfo = Field(description="Server-side information")
@@ -5,16 +5,20 @@ This bypasses the CLI and starts the server immediately.
 """
 
 import os
+import signal
 import sys
-import time
 
 from .service.system.storage import Storage
 from .service.system.crypto import CryptoService
 from .util.paths import Paths
+from .util.process import write_pid_file
 
 
 def main():
     """Main entry point for the server module."""
+    # Treat SIGTERM like Ctrl+C so the PID file is cleaned up; set before the PID file exists
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
     # Create file service for path management
     file_service = Storage()
     file_service.start()
@@ -29,7 +33,7 @@ def main():
     # Write PID file (inside container this goes to /var/run, outside it's managed by deployment)
     pid_file = file_service.pid_file_path()
     pid_file.parent.mkdir(parents=True, exist_ok=True)
-    pid_file.write_text(str(os.getpid()))
+    write_pid_file(pid_file, os.getpid())
 
     try:
         print(f"vldmcp server starting (PID: {os.getpid()})...")
@@ -40,15 +44,15 @@ def main():
 
         # Server implementation placeholder - replace with actual MCP server implementation
         print("Server daemon running. Press Ctrl+C to stop.")
+        # Sleep until a signal arrives; SIGINT/SIGTERM raise KeyboardInterrupt out of here
         while True:
-            time.sleep(1)
+            signal.pause()
 
     except KeyboardInterrupt:
         print("\nServer stopped by user")
     finally:
         # Clean up PID file (inside container)
-        if pid_file.exists():
-            pid_file.unlink()
+        pid_file.unlink(missing_ok=True)
         sys.exit(0)
 
 
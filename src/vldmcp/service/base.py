@@ -11,6 +11,7 @@ class Service:
     def __init__(self, parent=None, name=None):
         self.parent = parent
         self._running = False
+        self._stop_event = None  # Created by run(), needs the running loop
         self.children = {}  # Child services this service hosts
         self.exposed_methods = {}  # Registry of exposed methods
         self.name = name or self._get_name()
@@ -52,15 +53,18 @@ class Service:
         for service in self.children.values():
             service.stop()
         self._running = False
+        if self._stop_event:
+            self._stop_event.set()
 
     async def run(self):
         """Run this service and all children concurrently."""
         if self.children:
             await asyncio.gather(*[child.run() for child in self.children.values()])
         else:
-            # Default: just keep running while status is running
-            while self._running:
-                await asyncio.sleep(1.0)
+            # Default: wait until stop() is called
+            self._stop_event = asyncio.Event()
+            if self._running:
+                await self._stop_event.wait()
 
     def status(self) -> str:
         """Get the status of this service."""
@@ -102,11 +106,15 @@ class Service:
 
     def _register_exposed_methods(self):
         """Register all methods decorated with @expose or @share."""
+        # Same for every method, so walk the parent chain once
+        base_path = self.full_path()
+        root = self._get_root()
+
         for attr_name in dir(self):
             attr = getattr(self, attr_name)
             if callable(attr) and hasattr(attr, "_security"):
                 # This is an exposed method
-                method_path = f"{self.full_path()}/{attr_name}"
+                method_path = f"{base_path}/{attr_name}"
                 self.exposed_methods[attr_name] = {
                     "method": attr,
                     "security": attr._security,
@@ -114,7 +122,6 @@ class Service:
                 }
 
                 # Also register with root service if we have a parent
-                root = self._get_root()
                 if root and root != self:
                     if not hasattr(root, "_all_exposed_methods"):
                         root._all_exposed_methods = {}
@@ -171,10 +178,10 @@ def dispatch_any(obj_list, method_name, *args, **kwargs):
         AttributeError: If no object has the method
     """
     for obj in obj_list:
-        if hasattr(obj, method_name):
-            method = getattr(obj, method_name)
-            if callable(method):
-                return method(*args, **kwargs)
+        # One lookup per object; hasattr() would do the same getattr() internally
+        method = getattr(obj, method_name, None)
+        if callable(method):
+            return method(*args, **kwargs)
 
     raise AttributeError(f"No object in list has callable method '{method_name}'")
 
@@ -186,6 +193,8 @@ class MergedService(Service):
         # Use first service's name and path
         first = services[0] if services else None
         name = first.name if first else "merged"
+        self._attr_index = {}
+        self._resolve_order = tuple(reversed(services))  # Later services override earlier
         super().__init__(parent, name=name)
 
         # Merged service takes the path of the first service
@@ -198,17 +207,33 @@ class MergedService(Service):
             # Use a unique key since they might have name conflicts
             self.children[f"_merged_{id(service)}"] = service
 
+        # Map each public name to the position of the service that wins it (later services
+        # override earlier), including names those services resolve through their own __getattr__
+        for position, service in enumerate(self._resolve_order):
+            names = set(dir(service)) | set(service.children) | set(getattr(service, "_attr_index", ()))
+            for attr_name in names:
+                if not attr_name.startswith("_"):
+                    self._attr_index.setdefault(attr_name, position)
+
     def __getattr__(self, name):
         """Search for attribute in merged services (reverse order for priority)."""
         # First check if it's in our __dict__ to avoid infinite recursion
         if name.startswith("_"):
             raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
-        # Get services from children (they're stored with _merged_ prefix)
-        services = [svc for key, svc in self.children.items() if key.startswith("_merged_")]
+        # The index is a hint from merge time: trust it unless a higher-priority service
+        # has since gained the name as an attribute or child
+        position = self._attr_index.get(name)
+        if position is not None and not any(
+            name in vars(service) or name in service.children for service in self._resolve_order[:position]
+        ):
+            try:
+                return getattr(self._resolve_order[position], name)
+            except AttributeError:
+                pass  # Removed from the winning service since the merge
 
-        # Search services in reverse order (later services override earlier)
-        for service in reversed(services):
+        # Fall back to a scan for attributes added or removed after the merge
+        for service in self._resolve_order:
             try:
                 return getattr(service, name)
             except AttributeError:
@@ -1,5 +1,6 @@
 """Claim service for managing generic cryptographic claims."""
 
+from collections import defaultdict
 from typing import Any, Optional
 from datetime import datetime, UTC
 
@@ -16,6 +17,16 @@ class ClaimService(CRUDService):
         # Initialize CRUD service with Claim and Machine models
         super().__init__(storage, models=[Claim, Machine], parent=parent, name="claim")
 
+        # Lets identity and signer lookups use indexes instead of scanning every claim
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS idx_claim_identity "
+                "ON claim (payload_type, json_extract(payload, '$.identity_id'))"
+            )
+            conn.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS idx_claim_type_signer ON claim (payload_type, signer_pubkey)"
+            )
+
     def create_claim(self, payload_type: str, payload: dict[str, Any], signature: str, signer_pubkey: str) -> Claim:
         """Create a new generic claim.
 
@@ -59,8 +70,7 @@ class ClaimService(CRUDService):
 
     def get_identity_claims(self, identity_id: int) -> list[Claim]:
         """Get all identity claims for a specific identity ID."""
-        claims = self.read("claim", payload_type="identity_claim")
-        return [c for c in claims if c.payload.get("identity_id") == identity_id]
+        return self.read("claim", json_filters={"payload.identity_id": identity_id}, payload_type="identity_claim")
 
     def get_claims_by_signer(self, signer_pubkey: str) -> list[Claim]:
         """Get all claims made by a specific signer."""
@@ -71,8 +81,11 @@ class ClaimService(CRUDService):
 
         This shows conflicts when multiple people claim the same identity.
         """
-        claims = self.read("claim", payload_type="identity_claim")
-        return [c for c in claims if c.payload.get("provider") == provider and c.payload.get("value") == value]
+        return self.read(
+            "claim",
+            json_filters={"payload.provider": provider, "payload.value": value},
+            payload_type="identity_claim",
+        )
 
     def verify_claim(self, claim_id: int, verification_method: str = "manual") -> bool:
         """Mark a claim as verified.
@@ -96,13 +109,23 @@ class ClaimService(CRUDService):
 
     def has_conflicts(self, provider: str, value: str) -> bool:
         """Check if multiple people claim the same provider/value."""
-        claims = self.get_claims_for_provider_value(provider, value)
-        unique_claimers = set(c.payload.get("claimed_by") for c in claims if c.payload.get("claimed_by"))
-        return len(unique_claimers) > 1
+        claimers = self.count_distinct(
+            "claim",
+            "payload.claimed_by",
+            json_filters={"payload.provider": provider, "payload.value": value},
+            payload_type="identity_claim",
+        )
+        return claimers > 1
 
     def get_identity_summary(self, identity_id: int) -> dict:
         """Get a summary of all claims for an identity."""
-        claims = self.get_identity_claims(identity_id)
+        all_claims = self.read("claim", payload_type="identity_claim")
+        claims = [c for c in all_claims if c.payload.get("identity_id") == identity_id]
+
+        # Index every identity claim by provider/value once, rather than re-reading the table per claim
+        claims_by_value = defaultdict(list)
+        for c in all_claims:
+            claims_by_value[(c.payload.get("provider"), c.payload.get("value"))].append(c)
 
         summary = {
             "identity_id": identity_id,
@@ -132,7 +155,7 @@ class ClaimService(CRUDService):
             )
 
             # Check for conflicts
-            conflicts = self.get_claims_for_provider_value(provider, claim.payload.get("value"))
+            conflicts = claims_by_value[(provider, claim.payload.get("value"))]
             if len(conflicts) > 1:
                 conflict_key = f"{provider}:{claim.payload.get('value')}"
                 summary["conflicts"][conflict_key] = [
@@ -203,16 +226,7 @@ class ClaimService(CRUDService):
         Returns:
             Number of claims processed
         """
-        processed = 0
-
-        for claim_data in claims:
-            try:
-                # Upsert each claim
-                self.upsert("claim", unique_fields=["payload_type", "payload", "signer_pubkey"], **claim_data)
-                processed += 1
-            except Exception:
-                # Skip invalid claims
-                continue
+        processed = self.upsert_many("claim", ["payload_type", "payload", "signer_pubkey"], claims)
 
         # Update pull timestamp
         self.update_sync_time(machine_id, "pull")
@@ -1,7 +1,13 @@
 """CRUD service base class for data-driven services."""
 
-from typing import Type, Any
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Type, Any, ClassVar
 from datetime import datetime, UTC
+from pydantic import ValidationError
+from sqlalchemy import delete as sql_delete, event, func, literal, update as sql_update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import SQLModel, create_engine, Session, select
 
 from .base import Service
@@ -11,9 +17,20 @@ from .system.storage import Storage
 class CRUDService(Service):
     """Base service that provides CRUD operations for SQLModel classes."""
 
+    # Applied to every new SQLite connection; subclasses can override
+    PRAGMAS: ClassVar[dict[str, str | int]] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -20000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    }
+
     def __init__(self, storage: Storage, models: list[Type[SQLModel]], parent=None, name=None):
         super().__init__(parent, name)
         self.storage = storage
+        self._local = threading.local()  # Session shared by nested CRUD calls on this thread
 
         # Create database path and engine
         db_path = storage.database_path("service")
@@ -21,12 +38,16 @@ class CRUDService(Service):
 
         # SQLite connection string
         self.engine = create_engine(f"sqlite:///{db_path}")
+        event.listen(self.engine, "connect", self._apply_pragmas)
+        event.listen(self.engine, "begin", self._begin)
 
         # Store models by lowercase name for easy access
         self.models = {}
+        self._columns = {}  # Model class -> {field name: column attribute}, so filters skip hasattr probes
         for model in models:
             model_name = model.__name__.lower()
             self.models[model_name] = model
+            self._columns[model] = {field: getattr(model, field) for field in model.model_fields}
 
             # Make model accessible as attribute
             setattr(self, model_name, model)
@@ -34,6 +55,13 @@ class CRUDService(Service):
         # Create all tables
         SQLModel.metadata.create_all(self.engine)
 
+        # Index updated_at so get_records_since doesn't scan the whole table
+        with self.engine.begin() as conn:
+            for model in models:
+                if "updated_at" in self._columns[model]:
+                    table = model.__tablename__
+                    conn.exec_driver_sql(f"CREATE INDEX IF NOT EXISTS idx_{table}_updated_at ON {table} (updated_at)")
+
     def stop(self):
         """Stop the CRUD service and dispose of database engine."""
         # Dispose of SQLAlchemy engine to close all connections
@@ -41,40 +69,117 @@ class CRUDService(Service):
             self.engine.dispose()
         super().stop()
 
+    def _apply_pragmas(self, dbapi_connection, connection_record):
+        """Apply PRAGMAS to a newly opened SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        for name, value in self.PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+        # pysqlite only opens transactions before DML, so SAVEPOINTs would each commit on their own.
+        # Take over transaction control instead; _begin() starts every transaction explicitly.
+        dbapi_connection.isolation_level = None
+
+    def _begin(self, conn):
+        """Start a transaction with an explicit BEGIN, so savepoints nest inside it."""
+        conn.exec_driver_sql("BEGIN")
+
     def get_session(self) -> Session:
-        """Get a database session."""
-        return Session(self.engine)
+        """Get a database session.
+
+        Instances keep their loaded values after commit, so callers that skip refresh can still read them.
+        """
+        return Session(self.engine, expire_on_commit=False)
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        """Get this thread's open session, or open one for the duration of the block.
+
+        Nesting CRUD calls inside a `with self._session():` block makes them share
+        one session and its pooled connection instead of opening one per call.
+        They share the connection, not a transaction: each nested call that writes
+        commits, and that commits the outer block's pending changes with it.
+        """
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            yield session
+            return
+
+        with self.get_session() as session:
+            self._local.session = session
+            try:
+                yield session
+            finally:
+                self._local.session = None
 
-    def create(self, model_name: str, **kwargs) -> Any:
-        """Create a new record."""
+    def create(self, model_name: str, *, refresh: bool = True, **kwargs) -> Any:
+        """Create a new record.
+
+        Args:
+            model_name: Name of the model
+            refresh: Reload the record after commit (skip to save a SELECT)
+            **kwargs: Data for the record
+
+        Returns:
+            The created instance
+        """
         if model_name not in self.models:
             raise ValueError(f"Unknown model: {model_name}")
 
         model_class = self.models[model_name]
         instance = model_class(**kwargs)
 
-        with self.get_session() as session:
+        with self._session() as session:
             session.add(instance)
             session.commit()
-            session.refresh(instance)
+            if refresh:
+                session.refresh(instance)
             return instance
 
-    def read(self, model_name: str, **filters) -> list[Any]:
-        """Read records with optional filtering."""
+    def read(self, model_name: str, json_filters: dict | None = None, **filters) -> list[Any]:
+        """Read records with optional filtering.
+
+        Args:
+            model_name: Name of the model
+            json_filters: Filters on keys inside JSON columns, as {"column.key": value}
+            **filters: Filters on model fields
+
+        Returns:
+            Matching records
+        """
         if model_name not in self.models:
             raise ValueError(f"Unknown model: {model_name}")
 
         model_class = self.models[model_name]
 
-        with self.get_session() as session:
-            query = select(model_class)
+        with self._session() as session:
+            query = select(model_class).where(*self._conditions(model_class, filters, json_filters))
+            return session.exec(query).all()
 
-            # Apply filters
-            for field, value in filters.items():
-                if hasattr(model_class, field):
-                    query = query.where(getattr(model_class, field) == value)
+    def count_distinct(self, model_name: str, field: str, json_filters: dict | None = None, **filters) -> int:
+        """Count the distinct non-empty values of a field among records matching filters.
 
-            return session.exec(query).all()
+        NULLs and empty strings aren't counted.
+
+        Args:
+            model_name: Name of the model
+            field: Model field, or "column.key" for a key inside a JSON column
+            json_filters: Filters on keys inside JSON columns, as {"column.key": value}
+            **filters: Filters on model fields
+
+        Returns:
+            Number of distinct values
+        """
+        if model_name not in self.models:
+            raise ValueError(f"Unknown model: {model_name}")
+
+        model_class = self.models[model_name]
+        target = self._json_field(model_class, field) if "." in field else self._columns[model_class][field]
+
+        with self._session() as session:
+            # NULLIF turns '' into NULL, which COUNT skips
+            query = select(func.count(func.distinct(func.nullif(target, ""))))
+            return session.exec(query.where(*self._conditions(model_class, filters, json_filters))).one()
 
     def update(self, model_name: str, filters: dict, updates: dict) -> int:
         """Update records matching filters."""
@@ -82,30 +187,21 @@ class CRUDService(Service):
             raise ValueError(f"Unknown model: {model_name}")
 
         model_class = self.models[model_name]
+        columns = self._columns[model_class]
+        values = {key: value for key, value in updates.items() if key in columns}
 
-        with self.get_session() as session:
-            query = select(model_class)
-
-            # Apply filters
-            for field, value in filters.items():
-                if hasattr(model_class, field):
-                    query = query.where(getattr(model_class, field) == value)
-
-            # Get matching records
-            records = session.exec(query).all()
-
-            # Automatically set updated_at if the model has it
-            if hasattr(model_class, "updated_at"):
-                updates["updated_at"] = datetime.now(UTC)
-
-            # Update each record
-            count = 0
-            for record in records:
-                for key, value in updates.items():
-                    if hasattr(record, key):
-                        setattr(record, key, value)
-                count += 1
+        # Automatically set updated_at if the model has it
+        if "updated_at" in columns:
+            values["updated_at"] = datetime.now(UTC)
 
+        with self._session() as session:
+            conditions = self._conditions(model_class, filters)
+            if not values:
+                # Nothing to set, but callers still get the number of matching records
+                return session.exec(select(func.count()).select_from(model_class).where(*conditions)).one()
+
+            # A single UPDATE statement, without loading the matching rows
+            count = session.execute(sql_update(model_class).where(*conditions).values(**values)).rowcount
             session.commit()
             return count
 
@@ -116,29 +212,34 @@ class CRUDService(Service):
 
         model_class = self.models[model_name]
 
-        with self.get_session() as session:
-            query = select(model_class)
+        # A single DELETE statement, without loading the matching rows
+        with self._session() as session:
+            count = session.execute(sql_delete(model_class).where(*self._conditions(model_class, filters))).rowcount
+            session.commit()
+            return count
 
-            # Apply filters
-            for field, value in filters.items():
-                if hasattr(model_class, field):
-                    query = query.where(getattr(model_class, field) == value)
+    def _conditions(self, model_class: Type[SQLModel], filters: dict, json_filters: dict | None = None) -> list:
+        """Build equality conditions for the filters that name fields of the model, plus any JSON filters."""
+        columns = self._columns[model_class]
+        conditions = [columns[field] == value for field, value in filters.items() if field in columns]
+        conditions += [self._json_field(model_class, field) == value for field, value in (json_filters or {}).items()]
+        return conditions
 
-            # Get and delete records
-            records = session.exec(query).all()
-            count = len(records)
-            for record in records:
-                session.delete(record)
+    def _json_field(self, model_class: Type[SQLModel], field: str):
+        """Get a SQL expression for a key inside a JSON column, given as "column.key".
 
-            session.commit()
-            return count
+        The path is inlined rather than bound so SQLite can match it against expression indexes.
+        """
+        column, key = field.split(".", 1)
+        return func.json_extract(self._columns[model_class][column], literal(f"$.{key}", literal_execute=True))
 
-    def upsert(self, model_name: str, unique_fields: list[str], **kwargs) -> Any:
+    def upsert(self, model_name: str, unique_fields: list[str], *, refresh: bool = True, **kwargs) -> Any:
         """Insert or update a record based on unique fields.
 
         Args:
             model_name: Name of the model
             unique_fields: Fields that determine uniqueness
+            refresh: Reload the record after commit (skip to save a SELECT)
             **kwargs: Data for the record
 
         Returns:
@@ -149,40 +250,75 @@ class CRUDService(Service):
 
         model_class = self.models[model_name]
 
-        with self.get_session() as session:
-            # Build filter for existing record
-            filters = {}
-            for field in unique_fields:
-                if field in kwargs:
-                    filters[field] = kwargs[field]
-
-            # Try to find existing record
-            query = select(model_class)
-            for field, value in filters.items():
-                if hasattr(model_class, field):
-                    query = query.where(getattr(model_class, field) == value)
-
-            existing = session.exec(query).first()
-
-            if existing:
-                # Update existing record
-                if hasattr(model_class, "updated_at"):
-                    kwargs["updated_at"] = datetime.now(UTC)
-
-                for key, value in kwargs.items():
-                    if hasattr(existing, key):
-                        setattr(existing, key, value)
-
-                session.commit()
-                session.refresh(existing)
-                return existing
-            else:
-                # Create new record
-                instance = model_class(**kwargs)
-                session.add(instance)
-                session.commit()
+        with self._session() as session:
+            instance = self._upsert_in_session(session, model_class, unique_fields, kwargs)
+            session.commit()
+            if refresh:
                 session.refresh(instance)
-                return instance
+            return instance
+
+    def upsert_many(self, model_name: str, unique_fields: list[str], rows: list[dict]) -> int:
+        """Insert or update many records in a single transaction.
+
+        Rows that fail model validation or are rejected by the database are skipped.
+
+        Args:
+            model_name: Name of the model
+            unique_fields: Fields that determine uniqueness
+            rows: Data for each record
+
+        Returns:
+            Number of rows written
+        """
+        if model_name not in self.models:
+            raise ValueError(f"Unknown model: {model_name}")
+
+        model_class = self.models[model_name]
+        count = 0
+
+        with self._session() as session:
+            for row in rows:
+                try:
+                    # Store the validated values, so e.g. ISO timestamps arrive as datetimes
+                    data = model_class.model_validate(row).model_dump(include=set(row))
+                    # A savepoint per row, so a row the database rejects doesn't roll back the batch
+                    with session.begin_nested():
+                        self._upsert_in_session(session, model_class, unique_fields, data)
+                except (ValidationError, SQLAlchemyError):
+                    continue
+                count += 1
+
+            # One commit for the whole batch instead of one per row
+            session.commit()
+            return count
+
+    def _upsert_in_session(self, session: Session, model_class: Type[SQLModel], unique_fields: list[str], data: dict):
+        """Update the record matching data on unique_fields, or add a new one, without committing."""
+        # Build filter for existing record
+        filters = {}
+        for field in unique_fields:
+            if field in data:
+                filters[field] = data[field]
+
+        # Try to find existing record (autoflush makes earlier rows in a batch visible)
+        query = select(model_class).where(*self._conditions(model_class, filters))
+        existing = session.exec(query).first()
+
+        if existing:
+            # Update existing record
+            columns = self._columns[model_class]
+            if "updated_at" in columns:
+                data = {**data, "updated_at": datetime.now(UTC)}
+
+            for key, value in data.items():
+                if key in columns:
+                    setattr(existing, key, value)
+            return existing
+
+        # Create new record
+        instance = model_class(**data)
+        session.add(instance)
+        return instance
 
     def get_records_since(self, model_name: str, since: datetime) -> list[Any]:
         """Get records updated since a given timestamp.
@@ -193,12 +329,12 @@ class CRUDService(Service):
             raise ValueError(f"Unknown model: {model_name}")
 
         model_class = self.models[model_name]
+        columns = self._columns[model_class]
 
         # Only works if model has updated_at field
-        if not hasattr(model_class, "updated_at"):
+        if "updated_at" not in columns:
             raise ValueError(f"Model {model_name} does not have updated_at field")
 
-        with self.get_session() as session:
-            query = select(model_class)
-            query = query.where(getattr(model_class, "updated_at") > since)
+        with self._session() as session:
+            query = select(model_class).where(columns["updated_at"] > since)
             return session.exec(query).all()
@@ -5,7 +5,6 @@ import inspect
 from typing import Callable, Union
 from contextvars import ContextVar
 from contextlib import asynccontextmanager
-from datetime import datetime
 
 from ..models.call.context import Context
 from ..models.call.security import Security
@@ -44,6 +43,25 @@ def expose(security: Union[str, Security] = "owner"):
     return decorator
 
 
+# Context fields callers may set; auto-generated ones (request_id, timestamp) go to metadata instead
+_CONTEXT_FIELDS = frozenset(Context.model_fields) - {"request_id", "timestamp"}
+
+
+def _derive_context(current: Context, context_data: dict) -> Context:
+    """Copy a context with updates applied, leaving the original untouched.
+
+    model_copy() is a shallow copy without validation. metadata is the only field
+    mutated in place, so it is the only one that needs its own copy.
+    """
+    context = current.model_copy(update={"metadata": dict(current.metadata)})
+    for key, value in context_data.items():
+        if key in _CONTEXT_FIELDS:
+            setattr(context, key, value)
+        else:
+            context.metadata[key] = value
+    return context
+
+
 def set_context(**context_data):
     """Set the current request context."""
     if not context_data:
@@ -51,21 +69,7 @@ def set_context(**context_data):
         request_context.set(Context())
     else:
         # Create new context with updates
-        current = request_context.get()
-        # Update context fields
-        new_context = current.model_copy()
-        for key, value in context_data.items():
-            # Skip fields that aren't meant to be set directly (like timestamp which is a datetime)
-            if key == "timestamp" and not isinstance(value, datetime):
-                # Store non-datetime timestamp values in metadata
-                new_context.metadata[key] = value
-            elif hasattr(new_context, key) and key not in ["request_id", "timestamp"]:
-                # Set proper Context fields (but not auto-generated ones)
-                setattr(new_context, key, value)
-            else:
-                # Store in metadata for unknown fields or special cases
-                new_context.metadata[key] = value
-        request_context.set(new_context)
+        request_context.set(_derive_context(request_context.get(), context_data))
 
 
 def clear_context():
@@ -89,20 +93,7 @@ async def context_scope(**context_data):
     """Async context manager for setting request context with automatic cleanup."""
     # Get current context and create new one with updates
     current = request_context.get()
-    new_context = current.model_copy()
-
-    # Update context fields
-    for key, value in context_data.items():
-        # Skip fields that aren't meant to be set directly (like timestamp which is a datetime)
-        if key == "timestamp" and not isinstance(value, datetime):
-            # Store non-datetime timestamp values in metadata
-            new_context.metadata[key] = value
-        elif hasattr(new_context, key) and key not in ["request_id", "timestamp"]:
-            # Set proper Context fields (but not auto-generated ones)
-            setattr(new_context, key, value)
-        else:
-            # Store in metadata for unknown fields or special cases
-            new_context.metadata[key] = value
+    new_context = _derive_context(current, context_data)
 
     # Set the new context
     token = request_context.set(new_context)
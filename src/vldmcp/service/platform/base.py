@@ -1,6 +1,7 @@
 """Abstract base class for platform backends."""
 
-import subprocess
+import os
+import shutil
 from pathlib import Path
 
 from ..base import Service
@@ -9,7 +10,9 @@ from ..system.storage import Storage
 from ..system.crypto import CryptoService
 from ...models.disk_usage import DiskUsage, InstallUsage, McpUsage
 from ...models.info import ClientInfo
+from ...util.disk import get_dir_sizes
 from ...util.paths import Paths
+from ...util.process import read_pid_file
 
 
 class Platform(Service):
@@ -22,12 +25,23 @@ class Platform(Service):
         super().__init__(parent)
         # Platform has empty path for invisible routing
         self.path = ""
+        self._ports = None
 
         # Add core services that all platforms need
         storage = Storage(self)
         ConfigService(storage, self)
         CryptoService(self)
 
+    def get_ports(self) -> list[str]:
+        """Get port mappings from the platform config, read once until reload()."""
+        if self._ports is None:
+            self._ports = getattr(self.config.get_config().platform, "ports", [])
+        return self._ports
+
+    def reload(self):
+        """Drop cached configuration values so they are re-read on next use."""
+        self._ports = None
+
     def build(self, force: bool = False) -> bool:
         """Build the platform environment.
 
@@ -50,37 +64,24 @@ class Platform(Service):
         Returns:
             DiskUsage model with sizes in bytes by functional area
         """
-
-        # Helper to get directory size in bytes
-        def get_dir_size(path: Path) -> int:
-            if not path.exists():
-                return 0
-            try:
-                output = subprocess.run(["du", "-sb", str(path)], capture_output=True, text=True, check=True).stdout
-                return int(output.split()[0])
-            except (subprocess.CalledProcessError, ValueError):
-                return 0
-
-        # Calculate base sizes
-        config_size = get_dir_size(Paths.CONFIG) + get_dir_size(Paths.RUNTIME)
-
-        # Install breakdown
-        install_image_size = get_dir_size(Paths.INSTALL / "base") if Paths.INSTALL.exists() else 0
-        install_data_size = get_dir_size(Paths.DATA) + get_dir_size(Paths.STATE)
-
-        # MCP breakdown
-        repos_size = get_dir_size(Paths.REPOS)
-        mcp_images_size = 0  # Container backends will override this
-        mcp_data_size = get_dir_size(Paths.CACHE)
-
-        # WWW data
-        www_size = get_dir_size(Paths.WWW)
+        roots = [
+            Paths.CONFIG,
+            Paths.RUNTIME,
+            Paths.INSTALL / "base",
+            Paths.DATA,
+            Paths.STATE,
+            Paths.REPOS,
+            Paths.CACHE,
+            Paths.WWW,
+        ]
+        # Nested roots (install and www under data, repos under cache) are counted in one walk of their parent
+        config, runtime, install_base, data, state, repos, cache, www = get_dir_sizes(roots)
 
         return DiskUsage(
-            config=config_size,
-            install=InstallUsage(image=install_image_size, data=install_data_size),
-            mcp=McpUsage(repos=repos_size, images=mcp_images_size, data=mcp_data_size),
-            www=www_size,
+            config=config + runtime,
+            install=InstallUsage(image=install_base, data=data + state),
+            mcp=McpUsage(repos=repos, images=0, data=cache),  # Container backends fill in images
+            www=www,
         )
 
     def deploy(self) -> bool:
@@ -119,24 +120,11 @@ class Platform(Service):
         Returns:
             ClientInfo with current runtime status and configuration
         """
-        # Get ports from config
-        ports = []
-        # TODO: Add ports to platform config model
-
-        # Get server PID if running
-        server_pid = None
-        pid_file = self.storage.pid_file_path()
-        if pid_file.exists():
-            try:
-                server_pid = pid_file.read_text().strip()
-            except (OSError, ValueError):
-                pass
-
         return ClientInfo(
-            runtime_type=self.__class__.__name__.replace("Platform", "").lower(),
+            runtime_type=self.name,
             server_status=self.status(),
-            server_pid=server_pid,
-            ports=ports,
+            server_pid=read_pid_file(self.storage.pid_file_path()),
+            ports=self.get_ports(),
         )
 
     def status(self) -> str:
@@ -145,8 +133,8 @@ class Platform(Service):
         Returns:
             Status string ("running", "stopped", "not deployed", etc.)
         """
-        # Check if deployed (config exists)
-        if not Paths.CONFIG.exists():
+        # Check if deployed (config exists); access() skips building a stat result
+        if not os.access(Paths.CONFIG, os.F_OK):
             return "not deployed"
 
         return "stopped"
@@ -161,37 +149,29 @@ class Platform(Service):
         Returns:
             List of (description, path) tuples that were removed
         """
-        import shutil
-
         dirs_removed = []
 
         # Always remove install and cache
-        if Paths.INSTALL.exists():
-            shutil.rmtree(Paths.INSTALL)
-            dirs_removed.append(("install data", Paths.INSTALL))
-
-        if Paths.CACHE.exists():
-            shutil.rmtree(Paths.CACHE)
-            dirs_removed.append(("cache", Paths.CACHE))
+        _rmtree_if_exists(Paths.INSTALL, "install data", dirs_removed)
+        _rmtree_if_exists(Paths.CACHE, "cache", dirs_removed)
 
         # Config flag: also remove config and state
         if config or purge:
-            if Paths.CONFIG.exists():
-                shutil.rmtree(Paths.CONFIG)
-                dirs_removed.append(("configuration", Paths.CONFIG))
-
-            if Paths.STATE.exists():
-                shutil.rmtree(Paths.STATE)
-                dirs_removed.append(("state data", Paths.STATE))
-
-            if Paths.RUNTIME.exists():
-                shutil.rmtree(Paths.RUNTIME)
-                dirs_removed.append(("runtime data", Paths.RUNTIME))
+            _rmtree_if_exists(Paths.CONFIG, "configuration", dirs_removed)
+            _rmtree_if_exists(Paths.STATE, "state data", dirs_removed)
+            _rmtree_if_exists(Paths.RUNTIME, "runtime data", dirs_removed)
 
         # Purge flag: also remove user data (including keys)
         if purge:
-            if Paths.DATA.exists():
-                shutil.rmtree(Paths.DATA)
-                dirs_removed.append(("user data", Paths.DATA))
+            _rmtree_if_exists(Paths.DATA, "user data", dirs_removed)
 
         return dirs_removed
+
+
+def _rmtree_if_exists(path: Path, description: str, removed: list[tuple[str, Path]]) -> None:
+    """Remove a directory tree and record it in removed; does nothing if it's already gone."""
+    try:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        return
+    removed.append((description, path))
@@ -1,5 +1,7 @@
 """Platform detection and configuration for vldmcp deployments."""
 
+import functools
+import os
 import shutil
 
 from ...util.version import is_development
@@ -12,6 +14,17 @@ except ImportError:
 from ...models.config import PLATFORM_TYPES
 
 
+def has_command(cmd: str) -> bool:
+    """Check whether a command is on PATH (cached until PATH changes)."""
+    return _on_path(cmd, os.environ.get("PATH", ""))
+
+
+@functools.cache
+def _on_path(cmd: str, path: str) -> bool:
+    """Look up a command; path is only the cache key, which() reads the same PATH itself."""
+    return shutil.which(cmd) is not None
+
+
 def guess_platform() -> str:
     """Guess the best platform based on environment and available tools.
 
@@ -26,10 +39,10 @@ def guess_platform() -> str:
     if is_development():
         return "native"
 
-    if PodmanPlatform is not None and shutil.which("podman"):
+    if PodmanPlatform is not None and has_command("podman"):
         return "podman"
 
-    if shutil.which("vldmcpd"):
+    if has_command("vldmcpd"):
         return "native"
 
     # Default fallback - should rarely be reached
@@ -1,5 +1,8 @@
 """Native process platform backend."""
 
+import os
+import shutil
+
 from .base import Platform
 from ..system.daemon import DaemonService
 from ...util.paths import Paths
@@ -10,7 +13,9 @@ class NativePlatform(Platform):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.daemon = DaemonService(["vldmcpd"], self.storage.pid_file_path(), None, self)
+        # Resolve the executable once so each spawn skips the PATH walk
+        command = shutil.which("vldmcpd") or "vldmcpd"
+        self.daemon = DaemonService([command], self.storage.pid_file_path(), None, self)
 
     def build(self, force: bool = False) -> bool:
         """No build needed for native."""
@@ -18,7 +23,7 @@ class NativePlatform(Platform):
 
     def status(self) -> str:
         """Get platform status by checking daemon."""
-        if not Paths.CONFIG.exists():
+        if not os.access(Paths.CONFIG, os.F_OK):
             return "not deployed"
 
         return self.daemon.status()
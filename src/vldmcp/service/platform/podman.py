@@ -1,24 +1,62 @@
 """Podman container runtime backend."""
 
 import json
+import os
 import shutil
 import subprocess
 from pathlib import Path
 
 from ... import __version__
 from ...models.disk_usage import DiskUsage
+from ...util.disk import get_total_size
 from ...util.paths import Paths
 from .base import Platform
+from .podman_api import PodmanAPI, podman_socket_path
 
 
 class PodmanPlatform(Platform):
     """Podman container platform backend."""
 
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._podman_config = None
+        self._api = None
+
     def _get_podman_config(self):
-        """Get podman-specific configuration values."""
-        config = self.config.get_config()
-        plat = config.platform
-        return plat.image_name, plat.container_name
+        """Get podman-specific configuration values, read once until reload()."""
+        if self._podman_config is None:
+            plat = self.config.get_config().platform
+            self._podman_config = plat.image_name, plat.container_name
+        return self._podman_config
+
+    def reload(self):
+        """Drop cached configuration values so they are re-read on next use."""
+        super().reload()
+        self._podman_config = None
+
+    def _podman(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
+        """Run a podman CLI command and capture its text output."""
+        return subprocess.run(["podman", *args], capture_output=True, text=True, check=check)
+
+    def _get_api(self) -> PodmanAPI | None:
+        """Get the persistent podman API connection, if the rootless podman service socket exists."""
+        socket_path = podman_socket_path()
+        if self._api is None and socket_path and socket_path.exists():
+            self._api = PodmanAPI(socket_path)
+        return self._api
+
+    def _container_state(self, container_name: str) -> str | None:
+        """Get a container's state (e.g. "running", "exited"), or None if it doesn't exist."""
+        api = self._get_api()
+        if api:
+            try:
+                container = api.get(f"/containers/{container_name}/json")
+                return container["State"]["Status"] if container else None
+            except (OSError, RuntimeError):
+                pass  # Stale socket or a failing podman service; ask the CLI instead
+
+        result = self._podman("container", "inspect", "--format", "{{.State.Status}}", container_name, check=False)
+        return result.stdout.strip() if result.returncode == 0 else None
 
     def build(self, force: bool = False) -> bool:
         """Build container with podman."""
@@ -34,35 +72,27 @@ class PodmanPlatform(Platform):
         # Build with version spec if we have a known version
         version_spec = f"=={__version__}" if __version__ != "unknown" else ""
 
-        result = subprocess.run(
-            [
-                "podman",
-                "build",
-                "--build-arg",
-                f"VERSION_SPEC={version_spec}",
-                "-t",
-                image_name,
-                str(dockerfile.parent),
-            ],
-            capture_output=True,
+        result = self._podman(
+            "build",
+            "--build-arg",
+            f"VERSION_SPEC={version_spec}",
+            "-t",
+            image_name,
+            str(dockerfile.parent),
+            check=False,
         )
         return result.returncode == 0
 
     def status(self) -> str:
         """Check podman container status."""
-        if not self.storage.config_dir().exists():
+        if not os.access(Paths.CONFIG, os.F_OK):
             return "not deployed"
 
         _, container_name = self._get_podman_config()
-        result = subprocess.run(
-            ["podman", "ps", "-a", "--filter", f"name={container_name}"], capture_output=True, text=True
-        )
-        if container_name in result.stdout:
-            if "Up" in result.stdout:
-                return "running"
-            else:
-                return "stopped"
-        return "not found"
+        state = self._container_state(container_name)
+        if state is None:
+            return "not found"
+        return "running" if state == "running" else "stopped"
 
     def du(self) -> DiskUsage:
         """Get disk usage including container images and volumes.
@@ -77,45 +107,20 @@ class PodmanPlatform(Platform):
         images_size = 0
         try:
             # Get all vldmcp-related images
-            result = subprocess.run(
-                ["podman", "images", "--format", "json", "--filter", "reference=vldmcp*"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            if result.stdout:
-                images = json.loads(result.stdout)
-                for image in images:
-                    if "Size" in image:
-                        images_size += image["Size"]
-        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError):
+            result = self._podman("images", "--format", "json", "--filter", "reference=vldmcp*")
+            # JSON, not --format {{.Size}}: podman's template renders Size human-readable
+            images_size = sum(image.get("Size", 0) for image in json.loads(result.stdout or "[]"))
+        except (subprocess.CalledProcessError, json.JSONDecodeError):
             pass
 
         # Get container volumes size - add to mcp.data
         volumes_size = 0
         try:
-            # Get volumes used by vldmcp containers
-            result = subprocess.run(
-                ["podman", "volume", "ls", "--format", "json"], capture_output=True, text=True, check=True
-            )
-            if result.stdout:
-                volumes = json.loads(result.stdout)
-                for volume in volumes:
-                    if "vldmcp" in volume.get("Name"):
-                        # Get size of this volume
-                        vol_result = subprocess.run(
-                            ["podman", "volume", "inspect", volume["Name"]], capture_output=True, text=True, check=True
-                        )
-                        if vol_result.stdout:
-                            vol_info = json.loads(vol_result.stdout)
-                            if vol_info and "Mountpoint" in vol_info[0]:
-                                mount = vol_info[0]["Mountpoint"]
-                                # Get size of mountpoint
-                                du_result = subprocess.run(
-                                    ["du", "-sb", mount], capture_output=True, text=True, check=True
-                                )
-                                volumes_size += int(du_result.stdout.split()[0])
-        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError, ValueError):
+            # One call lists every vldmcp volume's mountpoint; sizes are then walked locally
+            result = self._podman("volume", "ls", "--filter", "name=vldmcp", "--format", "{{.Mountpoint}}")
+            # Walked concurrently, like the XDG roots; a mount nested in another is only counted once
+            volumes_size = get_total_size([Path(mount) for mount in result.stdout.splitlines()])
+        except subprocess.CalledProcessError:
             pass
 
         # Update container-specific sizes
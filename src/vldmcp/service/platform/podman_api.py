@@ -0,0 +1,69 @@
+"""Minimal client for the podman REST API over its unix socket."""
+
+import http.client
+import json
+import os
+import socket
+from pathlib import Path
+
+API_VERSION = "v4.0.0"
+
+
+def podman_socket_path() -> Path | None:
+    """Get the rootless podman API socket path under XDG_RUNTIME_DIR.
+
+    Without XDG_RUNTIME_DIR there is no rootless socket to use. The system-wide
+    one belongs to rootful podman, which the CLI wouldn't talk to, so None.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    return Path(runtime_dir) / "podman" / "podman.sock" if runtime_dir else None
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP/1.1 connection to a unix socket, kept open between requests."""
+
+    def __init__(self, socket_path: Path):
+        super().__init__("localhost")
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(str(self.socket_path))
+
+
+class PodmanAPI:
+    """Persistent connection to a podman service, replacing one podman process per call."""
+
+    def __init__(self, socket_path: Path):
+        self._conn = _UnixHTTPConnection(socket_path)
+
+    def get(self, path: str):
+        """GET a libpod endpoint.
+
+        Args:
+            path: Endpoint path below /libpod, e.g. "/containers/name/json"
+
+        Returns:
+            Decoded JSON response, or None if podman answered 404
+
+        Raises:
+            RuntimeError: If podman returned any other error status
+        """
+        try:
+            response = self._request("GET", path)
+        except ConnectionError:
+            # podman drops idle keep-alive connections; reconnect once
+            self._conn.close()
+            response = self._request("GET", path)
+        body = response.read()
+
+        if response.status == 404:
+            return None
+        if response.status >= 400:
+            raise RuntimeError(f"podman API {path} failed ({response.status}): {body.decode(errors='replace')}")
+        return json.loads(body)
+
+    def _request(self, method: str, path: str) -> http.client.HTTPResponse:
+        """Send a request to a libpod endpoint and return the response."""
+        self._conn.request(method, f"/{API_VERSION}/libpod{path}")
+        return self._conn.getresponse()
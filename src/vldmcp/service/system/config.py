@@ -11,17 +11,20 @@ class ConfigService(Service):
     def __init__(self, storage, parent=None):
         super().__init__(parent)
         self.data = PersistentDict(storage, "config.toml")
+        self._config = None
 
     def get_config(self) -> Config:
-        """Get the full configuration as a Config object."""
-        # Load raw dict and convert to Config model
-        raw_data = dict(self.data.items()) if self.data else {}
+        """Get the full configuration as a Config object, validated once until the next save."""
+        if self._config is None:
+            # Load raw dict and convert to Config model
+            raw_data = dict(self.data.items()) if self.data else {}
 
-        # Set defaults if empty
-        if not raw_data:
-            raw_data = {"platform": {"type": "guess"}}
+            # Set defaults if empty
+            if not raw_data:
+                raw_data = {"platform": {"type": "guess"}}
 
-        return Config.model_validate(raw_data)
+            self._config = Config.model_validate(raw_data)
+        return self._config
 
     def save_config(self, config: Config):
         """Save a Config object to storage."""
@@ -32,3 +35,4 @@ class ConfigService(Service):
         self.data.clear()
         for key, value in config_dict.items():
             self.data[key] = value
+        self._config = None
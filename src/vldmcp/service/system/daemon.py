@@ -1,11 +1,14 @@
 """Daemon service for vldmcp."""
 
+import fcntl
 import subprocess
-import signal
 import os
 from pathlib import Path
 from ..base import Service
 from ...util.paths import Paths
+from ...util.process import is_process_named, is_process_running, kill_process_gracefully
+
+_PID_FILE_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY
 
 
 class DaemonService(Service):
@@ -24,23 +27,65 @@ class DaemonService(Service):
 
     def _load_pid(self):
         """Load PID from file if daemon is already running."""
-        if self._pid_file.exists():
-            try:
-                pid = int(self._pid_file.read_text().strip())
-                # Check if process is actually running
-                os.kill(pid, 0)
-                self._pid = str(pid)
-            except (ValueError, ProcessLookupError, OSError):
-                # PID file is stale, remove it
-                self._pid_file.unlink(missing_ok=True)
-                self._pid = None
+        try:
+            with open(self._pid_file) as f:
+                # Waits for a concurrent start() to finish writing its PID, and holds off others while we check
+                fcntl.flock(f, fcntl.LOCK_EX)
+                content = f.read().strip()
+                if content.isdigit() and is_process_running(int(content)):
+                    self._pid = content
+                    return
+
+                # PID file is stale; remove it unless a concurrent start has already replaced it
+                if _is_current(f.fileno(), self._pid_file):
+                    self._pid_file.unlink()
+        except FileNotFoundError:
+            pass
+        self._pid = None
+
+    def _claim_pid_file(self) -> int | None:
+        """Exclusively create and lock the PID file, replacing it only if stale.
+
+        Returns:
+            Locked file descriptor for the new PID file, or None if a live daemon or another start owns it
+        """
+        try:
+            return self._create_pid_file()
+        except FileExistsError:
+            self._load_pid()
+            if self._pid:
+                return None
+
+        try:
+            return self._create_pid_file()
+        except FileExistsError:
+            # Another start claimed it after the stale one was cleared
+            self._load_pid()
+            return None
+
+    def _create_pid_file(self) -> int:
+        """Create and lock a new PID file.
+
+        Returns:
+            Locked file descriptor
+
+        Raises:
+            FileExistsError: If the file exists, or ours was cleared as stale before we could lock it
+        """
+        fd = os.open(self._pid_file, _PID_FILE_FLAGS, 0o644)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        if not _is_current(fd, self._pid_file):
+            os.close(fd)
+            raise FileExistsError(f"PID file {self._pid_file} was replaced before it could be locked")
+        return fd
 
     def start(self):
         """Start the daemon process."""
         self._pid_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Check if already running
-        if self._pid and self._is_running():
+        # Claiming the PID file is what stops two starts from spawning two daemons
+        pid_fd = self._claim_pid_file()
+        if pid_fd is None:
             print(f"Daemon already running with PID {self._pid}")
             return
 
@@ -54,7 +99,7 @@ class DaemonService(Service):
         stderr_log = log_dir / "vldmcp.err"
 
         # Start daemon in background, detached from terminal
-        with open(stdout_log, "a") as out, open(stderr_log, "a") as err:
+        with os.fdopen(pid_fd, "w") as pid_out, open(stdout_log, "a") as out, open(stderr_log, "a") as err:
             self._process = subprocess.Popen(
                 self._command,
                 stdout=out,
@@ -64,8 +109,8 @@ class DaemonService(Service):
             )
             self._pid = str(self._process.pid)
 
-        # Write PID file
-        self._pid_file.write_text(self._pid)
+            # Write PID file while still holding the lock
+            pid_out.write(self._pid)
 
         # Mark as running
         super().start()
@@ -73,13 +118,10 @@ class DaemonService(Service):
     def stop(self):
         """Stop the daemon process."""
         if self._pid:
-            try:
-                pid = int(self._pid)
-                # Send SIGTERM for graceful shutdown
-                os.kill(pid, signal.SIGTERM)
-                # TODO: Add timeout and SIGKILL if needed
-            except (ProcessLookupError, ValueError):
-                pass  # Process already dead
+            # Only signal the PID if it's still our command, not a reused PID
+            if is_process_named(int(self._pid), Path(self._command[0]).name):
+                # SIGTERM, escalating to SIGKILL if it doesn't exit in time
+                kill_process_gracefully(int(self._pid))
 
             # Clean up PID file
             self._pid_file.unlink(missing_ok=True)
@@ -107,10 +149,8 @@ class DaemonService(Service):
             return False
 
         try:
-            # Signal 0 doesn't kill, just checks if process exists
-            os.kill(int(self._pid), 0)
-            return True
-        except (ProcessLookupError, ValueError):
+            return is_process_running(int(self._pid))
+        except ValueError:
             return False
 
     def get_pid(self) -> str | None:
@@ -139,3 +179,11 @@ class DaemonService(Service):
         """Stream daemon logs to stdout."""
         # TODO: Implement log streaming
         print(self.logs())
+
+
+def _is_current(fd: int, path: Path) -> bool:
+    """Check that path still names the file open on fd."""
+    try:
+        return os.stat(path).st_ino == os.fstat(fd).st_ino
+    except FileNotFoundError:
+        return False
@@ -28,7 +28,7 @@ class Storage(Service):
 
     def node_dir(self, node_id: str) -> Path:
         """Get the directory for a specific node's data."""
-        return Paths.STATE / "nodes" / node_id
+        return Paths.NODES / node_id
 
     def node_key_path(self, node_id: str) -> Path:
         """Get a node key file path."""
@@ -136,29 +136,26 @@ class Storage(Service):
 
     def ensure_secure_permissions(self) -> None:
         """Ensure all sensitive directories and files have correct permissions."""
-        # Secure the keys directory
-        if Paths.KEYS.exists():
-            Paths.KEYS.chmod(0o700)
-
-            # Secure the user key file if it exists
-            user_key = self.user_key_path()
-            if user_key.exists():
-                user_key.chmod(0o600)
-
-        # Secure the state directory
-        if Paths.STATE.exists():
-            Paths.STATE.chmod(0o700)
-
-            # Secure all node directories and key files
-            nodes_dir = Paths.STATE / "nodes"
-            if nodes_dir.exists():
-                for node_path in nodes_dir.iterdir():
-                    if node_path.is_dir():
-                        node_path.chmod(0o700)
-                        key_file = node_path / "key"
-                        if key_file.exists():
-                            key_file.chmod(0o600)
-
-        # Secure the runtime directory
-        if Paths.RUNTIME.exists():
-            Paths.RUNTIME.chmod(0o700)
+        # chmod doubles as the existence check, so missing paths cost no extra stat
+        _chmod_if_exists(Paths.KEYS, 0o700)
+        _chmod_if_exists(self.user_key_path(), 0o600)
+        _chmod_if_exists(Paths.STATE, 0o700)
+        _chmod_if_exists(Paths.RUNTIME, 0o700)
+
+        # Secure all node directories and key files
+        try:
+            node_paths = list(Paths.NODES.iterdir())
+        except FileNotFoundError:
+            node_paths = []
+        for node_path in node_paths:
+            if node_path.is_dir():
+                node_path.chmod(0o700)
+                _chmod_if_exists(node_path / "key", 0o600)
+
+
+def _chmod_if_exists(path: Path, mode: int) -> None:
+    """Set a path's permissions; does nothing if it doesn't exist."""
+    try:
+        path.chmod(mode)
+    except FileNotFoundError:
+        pass
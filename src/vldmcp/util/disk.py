@@ -0,0 +1,89 @@
+"""Disk usage utilities."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Upper bound on concurrent directory walks
+MAX_WORKERS = 8
+
+
+def get_dir_size(path: Path) -> int:
+    """Get the apparent size of a directory tree in bytes (like `du -sb`).
+
+    Walks with os.fwalk so every entry is stat'd relative to its parent's
+    directory fd instead of resolving the full path each time.
+
+    Args:
+        path: Directory to measure
+
+    Returns:
+        Total size in bytes, or 0 if the path doesn't exist
+    """
+    return _walk_sizes(path, [path])[path]
+
+
+def get_dir_sizes(paths: list[Path]) -> list[int]:
+    """Get the sizes of several directory trees, walking shared subtrees once.
+
+    Paths nested inside another of the given paths are totalled during the
+    outer walk; the outermost trees are walked concurrently.
+
+    Args:
+        paths: Directories to measure
+
+    Returns:
+        Sizes in bytes in the same order as paths, 0 for any that don't exist
+    """
+    # Repeated paths (e.g. XDG dirs sharing a root) would otherwise be counted twice
+    unique = list(dict.fromkeys(paths))
+    groups = {top: [p for p in unique if p.is_relative_to(top)] for top in _outermost(unique)}
+
+    sizes = {}
+    # Walks are I/O bound, so threads overlap them
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(groups)) or 1) as pool:
+        for found in pool.map(_walk_sizes, groups, groups.values()):
+            sizes.update(found)
+    return [sizes[p] for p in paths]
+
+
+def get_total_size(paths: list[Path]) -> int:
+    """Get the combined size of several directory trees, counting overlaps once.
+
+    Args:
+        paths: Directories to measure, possibly nested inside one another
+
+    Returns:
+        Total size in bytes of everything under any of the paths
+    """
+    return sum(get_dir_sizes(_outermost(list(dict.fromkeys(paths)))))
+
+
+def _outermost(paths: list[Path]) -> list[Path]:
+    """Drop the paths that sit inside another of the (distinct) paths."""
+    return [p for p in paths if not any(p != other and p.is_relative_to(other) for other in paths)]
+
+
+def _walk_sizes(top: Path, nested: list[Path]) -> dict[Path, int]:
+    """Walk top once, totalling it and each of the nested directories inside it."""
+    sizes = dict.fromkeys(nested, 0)
+    try:
+        sizes[top] = os.lstat(top).st_size
+    except FileNotFoundError:
+        return sizes
+
+    roots = {str(p): p for p in nested}
+    for dirpath, dirs, files, dir_fd in os.fwalk(top):
+        inside = [p for p in nested if Path(dirpath).is_relative_to(p)]
+        for name in dirs + files:
+            try:
+                size = os.stat(name, dir_fd=dir_fd, follow_symlinks=False).st_size
+            except FileNotFoundError:
+                continue  # Deleted while we were walking
+            for p in inside:
+                sizes[p] += size
+            # A nested directory's own entry counts towards it as well as its parents
+            root = roots.get(os.path.join(dirpath, name))
+            if root is not None:
+                sizes[root] += size
+    return sizes
@@ -1,71 +1,96 @@
 """XDG-compliant path utilities for vldmcp."""
 
+import functools
 import os
 from pathlib import Path
 
+# Default XDG base directories, resolved once since $HOME doesn't change under us
+_HOME = Path.home()
+_DEFAULT_DATA_HOME = _HOME / ".local" / "share"
+_DEFAULT_CONFIG_HOME = _HOME / ".config"
+_DEFAULT_STATE_HOME = _HOME / ".local" / "state"
+_DEFAULT_CACHE_HOME = _HOME / ".cache"
+
+# Environment variables that the path table depends on
+_ENV_VARS = ("XDG_DATA_HOME", "XDG_CONFIG_HOME", "XDG_STATE_HOME", "XDG_CACHE_HOME", "XDG_RUNTIME_DIR", "USER")
+
+
+@functools.cache
+def _build_table(data_home, config_home, state_home, cache_home, runtime_dir, user) -> dict[str, Path]:
+    """Build every vldmcp path for one set of XDG environment values."""
+    data = Path(data_home or _DEFAULT_DATA_HOME) / "vldmcp"
+    state = Path(state_home or _DEFAULT_STATE_HOME) / "vldmcp"
+    cache = Path(cache_home or _DEFAULT_CACHE_HOME) / "vldmcp"
+
+    return {
+        "DATA": data,
+        "CONFIG": Path(config_home or _DEFAULT_CONFIG_HOME) / "vldmcp",
+        "STATE": state,
+        "CACHE": cache,
+        "RUNTIME": Path(runtime_dir or f"/tmp/vldmcp-{user or 'unknown'}") / "vldmcp",
+        "INSTALL": data / "install",
+        "KEYS": data / "keys",
+        "WWW": data / "www",
+        "NODES": state / "nodes",
+        "REPOS": cache / "src",
+        "BUILD": cache / "build",
+    }
 
-class _PathsClass:
-    """Standard paths for vldmcp following XDG Base Directory specification."""
-
-    @property
-    def _data_home(self):
-        return Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share"))
-
-    @property
-    def _config_home(self):
-        return Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
 
-    @property
-    def _state_home(self):
-        return Path(os.environ.get("XDG_STATE_HOME", Path.home() / ".local" / "state"))
+class _PathsClass:
+    """Standard paths for vldmcp following XDG Base Directory specification.
 
-    @property
-    def _cache_home(self):
-        return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    Paths are built once per distinct XDG environment and looked up from a table,
+    so changing the environment (e.g. in tests) is still picked up.
+    """
 
     @property
-    def _runtime_dir(self):
-        return Path(os.environ.get("XDG_RUNTIME_DIR", f"/tmp/vldmcp-{os.environ.get('USER', 'unknown')}"))
+    def _table(self) -> dict[str, Path]:
+        return _build_table(*map(os.environ.get, _ENV_VARS))
 
     @property
     def DATA(self):
-        return self._data_home / "vldmcp"
+        return self._table["DATA"]
 
     @property
     def CONFIG(self):
-        return self._config_home / "vldmcp"
+        return self._table["CONFIG"]
 
     @property
     def STATE(self):
-        return self._state_home / "vldmcp"
+        return self._table["STATE"]
 
     @property
     def CACHE(self):
-        return self._cache_home / "vldmcp"
+        return self._table["CACHE"]
 
     @property
     def RUNTIME(self):
-        return self._runtime_dir / "vldmcp"
+        return self._table["RUNTIME"]
 
     @property
     def INSTALL(self):
-        return self.DATA / "install"
+        return self._table["INSTALL"]
 
     @property
     def KEYS(self):
-        return self.DATA / "keys"
+        return self._table["KEYS"]
 
     @property
     def WWW(self):
-        return self.DATA / "www"
+        return self._table["WWW"]
+
+    @property
+    def NODES(self):
+        return self._table["NODES"]
 
     @property
     def REPOS(self):
-        return self.CACHE / "src"
+        return self._table["REPOS"]
 
     @property
     def BUILD(self):
-        return self.CACHE / "build"
+        return self._table["BUILD"]
 
 
 # Create singleton instance
@@ -2,9 +2,43 @@
 
 import os
 import signal
+import sys
 import time
 from pathlib import Path
 
+# On Linux a stat of /proc/<pid> answers liveness without the signal permission checks
+_HAS_PROC = sys.platform.startswith("linux")
+
+
+def is_process_named(pid: int, name: str) -> bool:
+    """Check a process's command name, to avoid acting on a reused PID.
+
+    Only /proc can tell us this; without it the name is assumed to match.
+
+    Args:
+        pid: Process ID to check
+        name: Expected command name (compared as the kernel stores it, max 15 chars)
+
+    Returns:
+        True if the process has this name, False otherwise
+    """
+    if not _HAS_PROC:
+        return True
+
+    try:
+        return Path(f"/proc/{pid}/comm").read_text().strip() == name[:15]
+    except OSError:
+        return False
+
+
+def _has_exited(pid: int) -> bool:
+    """Check whether a process has exited, reaping it first if it's our child."""
+    try:
+        os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        pass  # Not our child, so it can't linger here as a zombie
+    return not is_process_running(pid)
+
 
 def kill_process_gracefully(pid: int, timeout: int = 10) -> bool:
     """Kill a process gracefully with SIGTERM, then SIGKILL if needed.
@@ -16,11 +50,7 @@ def kill_process_gracefully(pid: int, timeout: int = 10) -> bool:
     Returns:
         True if process was killed, False if process didn't exist
     """
-    try:
-        # Check if process exists
-        os.kill(pid, 0)
-    except (OSError, ProcessLookupError):
-        # Process doesn't exist
+    if _has_exited(pid):
         return False
 
     try:
@@ -29,12 +59,9 @@ def kill_process_gracefully(pid: int, timeout: int = 10) -> bool:
 
         # Wait for process to exit
         for _ in range(timeout * 10):  # Check every 100ms
-            try:
-                os.kill(pid, 0)
-                time.sleep(0.1)
-            except (OSError, ProcessLookupError):
-                # Process has exited
+            if _has_exited(pid):
                 return True
+            time.sleep(0.1)
 
         # Process still alive, force kill
         os.kill(pid, signal.SIGKILL)
@@ -45,6 +72,48 @@ def kill_process_gracefully(pid: int, timeout: int = 10) -> bool:
         return True
 
 
+def write_pid_file(path: Path, pid: int) -> None:
+    """Atomically write a PID file, so readers never see it empty or half-written.
+
+    Args:
+        path: PID file path
+        pid: Process ID to record
+    """
+    tmp_path = path.with_name(f"{path.name}.{pid}.tmp")
+    with open(tmp_path, "w") as f:
+        f.write(str(pid))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    # Persist the rename itself
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def read_pid_file(path: Path) -> str | None:
+    """Read a PID file with a single open and read.
+
+    Args:
+        path: PID file path
+
+    Returns:
+        The stripped contents, or None if the file is missing, unreadable or empty
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        # PID files hold one short ASCII line
+        return os.read(fd, 64).decode("ascii", errors="replace").strip() or None
+    finally:
+        os.close(fd)
+
+
 def kill_process_from_pidfile(pidfile_path: Path, timeout: int = 10) -> bool:
     """Kill process using PID from file, then remove the PID file.
 
@@ -55,12 +124,11 @@ def kill_process_from_pidfile(pidfile_path: Path, timeout: int = 10) -> bool:
     Returns:
         True if process was killed or didn't exist, False on error
     """
-    if not pidfile_path.exists():
+    pid_content = read_pid_file(pidfile_path)
+    if pid_content is None:
         return True  # No PID file means no process running
 
     try:
-        pid_content = pidfile_path.read_text().strip()
-
         # Handle container PIDs (format: "container:123")
         if pid_content.startswith("container:"):
             # For container PIDs, we don't kill directly - the runtime handles it
@@ -94,8 +162,14 @@ def is_process_running(pid: int) -> bool:
     Returns:
         True if process exists, False otherwise
     """
+    if _HAS_PROC:
+        return os.path.exists(f"/proc/{pid}")
+
     try:
         os.kill(pid, 0)
-        return True
-    except (OSError, ProcessLookupError):
+    except ProcessLookupError:
         return False
+    except PermissionError:
+        # EPERM means the process exists, it just isn't ours to signal
+        return True
+    return True
@@ -0,0 +1,15 @@
+"""Tests for the info command."""
+
+import click.testing
+
+from vldmcp.cli import cli
+from vldmcp.service.platform import get_platform
+
+
+def test_info_reports_client_info(xdg_dirs):
+    """Test that info prints the platform's client info through the combined response."""
+    result = click.testing.CliRunner().invoke(cli, ["info"])
+
+    assert result.exit_code == 0
+    assert f"client.runtime_type\t{get_platform().name}" in result.output.splitlines()
+    assert "client.server_status\tnot deployed" in result.output.splitlines()
@@ -3,10 +3,19 @@
 import pytest
 from unittest.mock import patch
 
-from vldmcp.service.platform.detection import guess_platform, get_platform
+from vldmcp.service.platform import detection
+from vldmcp.service.platform.detection import guess_platform, get_platform, has_command
 from vldmcp.service.platform.native import NativePlatform
 
 
+@pytest.fixture(autouse=True)
+def clear_command_cache():
+    """Forget cached command lookups so each test sees its own patched PATH."""
+    detection._on_path.cache_clear()
+    yield
+    detection._on_path.cache_clear()
+
+
 def test_guess_platform_development():
     """Test that development mode always returns native."""
     with patch("vldmcp.service.platform.detection.is_development", return_value=True):
@@ -92,3 +101,23 @@ def test_get_platform_guess_auto_detects():
     with patch("vldmcp.service.platform.detection.guess_platform", return_value="native"):
         platform = get_platform("guess")
         assert isinstance(platform, NativePlatform)
+
+
+def test_has_command_is_cached():
+    """Test that command lookups are only done once per command."""
+    with patch("vldmcp.service.platform.detection.shutil.which", return_value="/usr/bin/podman") as mock_which:
+        assert has_command("podman")
+        assert has_command("podman")
+
+    mock_which.assert_called_once_with("podman")
+
+
+def test_has_command_cache_follows_path(monkeypatch):
+    """Test that changing PATH triggers a fresh lookup."""
+    with patch("vldmcp.service.platform.detection.shutil.which", return_value=None) as mock_which:
+        monkeypatch.setenv("PATH", "/one")
+        assert not has_command("podman")
+        monkeypatch.setenv("PATH", "/two")
+        assert not has_command("podman")
+
+    assert mock_which.call_count == 2
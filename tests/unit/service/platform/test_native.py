@@ -1,6 +1,8 @@
 """Tests for native platform."""
 
+from vldmcp.models.config import Config, PodmanConfig
 from vldmcp.service.platform.native import NativePlatform
+from vldmcp.util.disk import get_dir_size
 from vldmcp.util.paths import Paths
 
 
@@ -99,6 +101,19 @@ def test_native_platform_info(xdg_dirs):
     assert info.server_status in ["running", "stopped", "not deployed"]
 
 
+def test_native_platform_info_ports_cached_until_reload(xdg_dirs):
+    """Test that configured ports are read once and refreshed by reload()."""
+    platform = NativePlatform()
+    platform.deploy()
+    assert platform.info().ports == []
+
+    platform.config.save_config(Config(platform=PodmanConfig(ports=["9000:9000"])))
+    assert platform.info().ports == []
+
+    platform.reload()
+    assert platform.info().ports == ["9000:9000"]
+
+
 def test_native_platform_du(xdg_dirs):
     """Test disk usage calculation."""
     platform = NativePlatform()
@@ -110,6 +125,21 @@ def test_native_platform_du(xdg_dirs):
     assert usage.mcp.repos >= 0
 
 
+def test_native_platform_du_buckets(xdg_dirs):
+    """Test that each area's size comes from its own directory."""
+    platform = NativePlatform()
+    (Paths.WWW / "site").mkdir(parents=True)
+    (Paths.WWW / "site" / "index.html").write_bytes(b"x" * 5000)
+    (Paths.REPOS).mkdir(parents=True)
+    (Paths.REPOS / "repo.pack").write_bytes(b"x" * 7000)
+
+    usage = platform.du()
+
+    assert usage.www == get_dir_size(Paths.WWW) > 5000
+    assert usage.mcp.repos == get_dir_size(Paths.REPOS) > 7000
+    assert usage.mcp.data == get_dir_size(Paths.CACHE)
+
+
 def test_native_platform_remove(xdg_dirs):
     """Test removing platform."""
     platform = NativePlatform()
@@ -122,3 +152,8 @@ def test_native_platform_remove(xdg_dirs):
     removed = platform.remove()
     assert len(removed) > 0
     assert not Paths.INSTALL.exists()
+
+
+def test_native_platform_remove_missing_dirs(xdg_dirs):
+    """Test that removing with nothing on disk reports nothing removed."""
+    assert NativePlatform().remove(purge=True) == []
@@ -0,0 +1,169 @@
+"""Tests for podman platform."""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from vldmcp.models.config import Config, PodmanConfig
+from vldmcp.service.platform.podman import PodmanPlatform
+from vldmcp.service.platform.podman_api import podman_socket_path
+
+
+class FakePodmanHandler(BaseHTTPRequestHandler):
+    """Answers libpod container inspect requests from a dict of container states."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        name = self.path.split("/")[-2]
+        if self.server.error_status:
+            self._reply(self.server.error_status, {"message": "internal error"})
+        elif name in self.server.containers:
+            self._reply(200, {"State": {"Status": self.server.containers[name]}})
+        else:
+            self._reply(404, {"message": "no such container"})
+        # Hang up without telling the client, like podman does to idle connections
+        self.close_connection = self.server.drop_connections
+
+    def _reply(self, status, data):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakePodmanServer(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server whose keep-alive handler threads don't block shutdown."""
+
+    daemon_threads = True
+    block_on_close = False
+
+
+@pytest.fixture
+def podman_service(xdg_dirs):
+    """Run a fake podman API service on the rootless socket path."""
+    socket_path = podman_socket_path()
+    socket_path.parent.mkdir(parents=True)
+
+    server = FakePodmanServer(str(socket_path), FakePodmanHandler)
+    server.containers = {}
+    server.paths = []
+    server.connections = 0
+    server.drop_connections = False
+    server.error_status = None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def podman_cli(xdg_dirs, monkeypatch):
+    """Put a fake podman CLI on PATH that reports every container as running."""
+    fake_podman = xdg_dirs / "bin" / "podman"
+    fake_podman.parent.mkdir()
+    fake_podman.write_text("#!/bin/sh\necho running\n")
+    fake_podman.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{fake_podman.parent}{os.pathsep}{os.environ['PATH']}")
+
+
+def deployed_platform():
+    """Create a podman platform with config saved, so it counts as deployed."""
+    platform = PodmanPlatform()
+    platform.config.save_config(Config(platform=PodmanConfig(container_name="vldmcp-test")))
+    return platform
+
+
+def test_podman_config_cached_until_reload(xdg_dirs):
+    """Test that podman config values are read once and refreshed by reload()."""
+    platform = PodmanPlatform()
+    platform.config.save_config(Config(platform=PodmanConfig(image_name="one:latest", container_name="one")))
+    assert platform._get_podman_config() == ("one:latest", "one")
+
+    platform.config.save_config(Config(platform=PodmanConfig(image_name="two:latest", container_name="two")))
+    assert platform._get_podman_config() == ("one:latest", "one")
+
+    platform.reload()
+    assert platform._get_podman_config() == ("two:latest", "two")
+
+
+def test_podman_status_not_deployed(xdg_dirs):
+    """Test status before any config has been written."""
+    assert PodmanPlatform().status() == "not deployed"
+
+
+def test_podman_status_via_api(podman_service):
+    """Test that status is read from the podman API and maps container states."""
+    platform = deployed_platform()
+
+    assert platform.status() == "not found"
+
+    podman_service.containers["vldmcp-test"] = "exited"
+    assert platform.status() == "stopped"
+
+    podman_service.containers["vldmcp-test"] = "running"
+    assert platform.status() == "running"
+
+    assert podman_service.paths[-1] == "/v4.0.0/libpod/containers/vldmcp-test/json"
+
+
+def test_podman_api_connection_is_reused(podman_service):
+    """Test that repeated status calls share one socket connection."""
+    platform = deployed_platform()
+
+    for _ in range(5):
+        platform.status()
+
+    assert len(podman_service.paths) == 5
+    assert podman_service.connections == 1
+
+
+def test_podman_api_reconnects_after_drop(podman_service):
+    """Test that a connection closed by podman is reopened on the next call."""
+    platform = deployed_platform()
+    podman_service.containers["vldmcp-test"] = "running"
+    podman_service.drop_connections = True
+
+    for _ in range(3):
+        assert platform.status() == "running"
+
+    assert podman_service.connections == 3
+
+
+def test_podman_status_falls_back_to_cli_on_stale_socket(xdg_dirs, podman_cli):
+    """Test that a socket file with no podman service behind it falls back to the podman CLI."""
+    socket_path = podman_socket_path()
+    socket_path.parent.mkdir(parents=True)
+    with socket.socket(socket.AF_UNIX) as stale:
+        stale.bind(str(socket_path))  # Leaves the file behind without ever listening
+
+    assert deployed_platform().status() == "running"
+
+
+def test_podman_status_falls_back_to_cli_on_api_error(podman_service, podman_cli):
+    """Test that an error status from the podman API falls back to the podman CLI."""
+    podman_service.error_status = 500
+
+    assert deployed_platform().status() == "running"
+
+
+def test_podman_socket_path_needs_runtime_dir(monkeypatch):
+    """Test that without XDG_RUNTIME_DIR there's no rootless socket, rather than falling back to the rootful one."""
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+
+    assert podman_socket_path() is None
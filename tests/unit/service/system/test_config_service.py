@@ -0,0 +1,22 @@
+"""Tests for the configuration service."""
+
+from vldmcp.models.config import Config, PodmanConfig
+from vldmcp.service.system.config import ConfigService
+from vldmcp.service.system.storage import Storage
+
+
+def test_get_config_defaults(xdg_dirs):
+    """Test that an empty config falls back to platform guessing."""
+    assert ConfigService(Storage()).get_config().platform.type == "guess"
+
+
+def test_get_config_cached_until_save(xdg_dirs):
+    """Test that the validated config is reused until save_config() replaces it."""
+    config = ConfigService(Storage())
+    first = config.get_config()
+    assert config.get_config() is first
+
+    config.save_config(Config(platform=PodmanConfig(container_name="saved")))
+
+    assert config.get_config() is not first
+    assert config.get_config().platform.container_name == "saved"
@@ -1,6 +1,7 @@
 """Tests for the daemon service."""
 
 import os
+import subprocess
 import time
 import tempfile
 from pathlib import Path
@@ -96,6 +97,21 @@ def test_daemon_start_stop_sleep(temp_dir):
     assert not pid_file.exists()
 
 
+def test_daemon_does_not_inherit_parent_fds(temp_dir):
+    """Test that a descriptor the caller left inheritable isn't held open by the daemon."""
+    read_fd, write_fd = os.pipe()
+    os.set_inheritable(write_fd, True)
+
+    daemon = DaemonService(["sleep", "30"], temp_dir / "test.pid", temp_dir / "logs")
+    try:
+        daemon.start()
+        assert sorted(os.listdir(f"/proc/{daemon._pid}/fd")) == ["0", "1", "2"]
+    finally:
+        daemon.stop()
+        os.close(read_fd)
+        os.close(write_fd)
+
+
 def test_daemon_already_running(temp_dir, capsys):
     """Test that starting doesn't create duplicate if already running."""
     pid_file = temp_dir / "test.pid"
@@ -115,6 +131,54 @@ def test_daemon_already_running(temp_dir, capsys):
     daemon.stop()
 
 
+def test_daemon_shared_pid_file_spawns_once(temp_dir, capsys):
+    """Test that two services created before either starts only spawn one daemon."""
+    pid_file = temp_dir / "test.pid"
+    log_dir = temp_dir / "logs"
+
+    first = DaemonService(["sleep", "30"], pid_file, log_dir)
+    second = DaemonService(["sleep", "30"], pid_file, log_dir)
+
+    first.start()
+    second.start()
+
+    assert "already running" in capsys.readouterr().out.lower()
+    assert second._process is None
+    assert second._pid == first._pid == pid_file.read_text()
+
+    first.stop()
+
+
+class RacedDaemonService(DaemonService):
+    """Daemon whose stale PID file is claimed by a rival start right after it's cleared."""
+
+    race = False
+    rival = None
+
+    def _load_pid(self):
+        super()._load_pid()
+        if self.race:
+            self.race = False
+            self.rival = DaemonService(["sleep", "30"], self._pid_file, self._log_dir)
+            self.rival.start()
+
+
+def test_daemon_start_loses_race_for_cleared_pid_file(temp_dir, capsys):
+    """Test that a start beaten to a cleared stale PID file reports the winner instead of raising."""
+    pid_file = temp_dir / "test.pid"
+    daemon = RacedDaemonService(["sleep", "30"], pid_file, temp_dir / "logs")
+    pid_file.write_text("99999999")
+    daemon.race = True
+
+    daemon.start()
+    try:
+        assert daemon._process is None
+        assert daemon._pid == daemon.rival._pid == pid_file.read_text()
+        assert "already running" in capsys.readouterr().out.lower()
+    finally:
+        daemon.rival.stop()
+
+
 def test_daemon_status_methods(temp_dir):
     """Test status and _is_running methods."""
     pid_file = temp_dir / "test.pid"
@@ -161,6 +225,19 @@ def test_daemon_stop_dead_process(temp_dir):
     assert daemon._pid is None
 
 
+def test_daemon_stop_skips_reused_pid(temp_dir):
+    """Test that stop doesn't signal a process that isn't running our command."""
+    other = subprocess.Popen(["sleep", "30"])
+    daemon = DaemonService(["vldmcpd"], temp_dir / "test.pid")
+    daemon._pid = str(other.pid)
+
+    daemon.stop()
+
+    assert other.poll() is None
+    other.kill()
+    other.wait()
+
+
 def test_multiple_daemons(temp_dir):
     """Test multiple daemon instances with different PID files."""
     pid_file1 = temp_dir / "daemon1.pid"
@@ -19,6 +19,7 @@ def temp_storage():
             mock_paths.CONFIG = temp_path / "config"
             mock_paths.DATA = temp_path / "data"
             mock_paths.STATE = temp_path / "state"
+            mock_paths.NODES = temp_path / "state" / "nodes"
             mock_paths.CACHE = temp_path / "cache"
             mock_paths.RUNTIME = temp_path / "runtime"
             mock_paths.KEYS = temp_path / "keys"
@@ -246,3 +247,21 @@ def test_secure_permissions_called_on_start(temp_storage):
     # Start should call ensure_secure_permissions
     temp_storage.start()
     assert call_count == 1
+
+
+def test_ensure_secure_permissions(temp_storage):
+    """Test that keys, state, runtime and node files are locked down, and missing paths are skipped."""
+    base_path = temp_storage._temp_path
+    node_dir = base_path / "state" / "nodes" / "node1"
+    node_dir.mkdir(parents=True, mode=0o755)
+    (node_dir / "key").write_text("secret")
+    (node_dir / "key").chmod(0o644)
+    (base_path / "state" / "nodes" / "notes.txt").write_text("not a node")
+
+    temp_storage.ensure_secure_permissions()
+
+    assert (base_path / "state").stat().st_mode & 0o777 == 0o700
+    assert node_dir.stat().st_mode & 0o777 == 0o700
+    assert (node_dir / "key").stat().st_mode & 0o777 == 0o600
+    assert not (base_path / "keys").exists()
+    assert not (base_path / "runtime").exists()
@@ -187,6 +187,21 @@ def test_service_run_no_children():
     asyncio.run(test_async())
 
 
+def test_service_run_returns_on_stop():
+    """Test that run() wakes as soon as stop() is called."""
+
+    async def test_async():
+        service = Service()
+        service.start()
+        task = asyncio.create_task(service.run())
+        await asyncio.sleep(0)
+
+        service.stop()
+        await asyncio.wait_for(task, timeout=0.5)
+
+    asyncio.run(test_async())
+
+
 def test_service_run_with_children():
     """Test running service with children."""
 
@@ -318,6 +333,58 @@ def test_merged_service_attribute_priority():
     assert merged.unique_to_second == "unique2"
 
 
+def test_merged_service_child_priority():
+    """Test that a later service's child outranks an earlier service's attribute."""
+
+    class Service1(Service):
+        storage = "attribute"
+
+    service1 = Service1(name="service1")
+    service2 = Service(name="service2")
+    storage = Service(name="storage", parent=service2)
+    merged = MergedService([service1, service2])
+
+    assert merged.storage is storage
+
+    # Attributes added after the merge are still found
+    service1.late_attr = "late"
+    assert merged.late_attr == "late"
+
+
+def test_merged_service_late_override():
+    """Test that attributes and children added to a higher-priority service after the merge win."""
+
+    class Service1(Service):
+        shared_attr = "first"
+        shared_child = "attribute"
+
+    service1 = Service1(name="service1")
+    service2 = Service(name="service2")
+    merged = MergedService([service1, service2])
+    assert merged.shared_attr == "first"
+    assert merged.shared_child == "attribute"
+
+    service2.shared_attr = "second"
+    child = Service(name="shared_child", parent=service2)
+
+    assert merged.shared_attr == "second"
+    assert merged.shared_child is child
+
+
+def test_merged_service_removed_attribute_falls_through():
+    """Test that removing an attribute from the winning service exposes the next one."""
+    service1 = Service(name="service1")
+    service2 = Service(name="service2")
+    service1.option = "first"
+    service2.option = "second"
+    merged = MergedService([service1, service2])
+    assert merged.option == "second"
+
+    del service2.option
+
+    assert merged.option == "first"
+
+
 def test_merged_service_attribute_error():
     """Test AttributeError in merged service."""
     service1 = Service(name="service1")
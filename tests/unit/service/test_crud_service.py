@@ -6,6 +6,7 @@ from tempfile import TemporaryDirectory
 from pathlib import Path
 from typing import Optional
 
+from sqlalchemy import event
 from sqlmodel import SQLModel, Field
 
 from vldmcp.service.crud import CRUDService
@@ -22,6 +23,13 @@ class CrudTestModel(SQLModel, table=True):
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC), description="Update time")
 
 
+class PlainTestModel(SQLModel, table=True):
+    """Test model without timestamps."""
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(description="Name field")
+
+
 @pytest.fixture
 def temp_storage():
     """Create temporary storage for testing."""
@@ -53,6 +61,18 @@ def test_create_record(crud_service):
     assert record.updated_at is not None
 
 
+def test_create_without_refresh(crud_service):
+    """Test that a record created without refresh still has its key and values."""
+    record = crud_service.create("crudtestmodel", refresh=False, name="norefresh", value=5)
+
+    assert record.id is not None
+    assert record.name == "norefresh"
+    assert crud_service.read("crudtestmodel", id=record.id)[0].value == 5
+
+    with pytest.raises(TypeError):
+        crud_service.create("crudtestmodel", False, name="positional", value=6)
+
+
 def test_read_records(crud_service):
     """Test reading records with filters."""
     # Create test data
@@ -154,6 +174,106 @@ def test_get_records_since(crud_service):
     assert len(future_records) == 0
 
 
+def test_count_distinct(crud_service):
+    """Test counting distinct values of a field among filtered records."""
+    crud_service.create("crudtestmodel", name="a", value=1)
+    crud_service.create("crudtestmodel", name="a", value=2)
+    crud_service.create("crudtestmodel", name="a", value=2)
+    crud_service.create("crudtestmodel", name="b", value=3)
+    crud_service.create("crudtestmodel", name="", value=4)
+
+    assert crud_service.count_distinct("crudtestmodel", "value", name="a") == 2
+    assert crud_service.count_distinct("crudtestmodel", "name") == 2
+
+
+def test_upsert_many(crud_service):
+    """Test batch upsert updates matches, dedupes within the batch and skips invalid rows."""
+    crud_service.create("crudtestmodel", name="existing", value=1)
+
+    rows = [
+        {"name": "existing", "value": 10},
+        {"name": "new", "value": 20},
+        {"name": "new", "value": 30},
+        {"name": "invalid"},
+    ]
+    assert crud_service.upsert_many("crudtestmodel", ["name"], rows) == 3
+
+    assert [r.value for r in crud_service.read("crudtestmodel", name="existing")] == [10]
+    assert [r.value for r in crud_service.read("crudtestmodel", name="new")] == [30]
+    assert crud_service.read("crudtestmodel", name="invalid") == []
+
+
+def test_upsert_many_writes_one_transaction(crud_service):
+    """Test that a batch's per-row savepoints nest inside a single transaction and commit once."""
+    statements = []
+    event.listen(crud_service.engine, "before_cursor_execute", lambda *args: statements.append(args[2].split()[0]))
+    event.listen(crud_service.engine, "commit", lambda conn: statements.append("COMMIT"))
+
+    rows = [{"name": f"batch{i}", "value": i} for i in range(3)]
+    assert crud_service.upsert_many("crudtestmodel", ["name"], rows) == 3
+
+    assert statements[0] == "BEGIN"
+    assert statements.count("BEGIN") == 1
+    assert statements.count("SAVEPOINT") == 3
+    assert statements[-1] == "COMMIT"
+    assert statements.count("COMMIT") == 1
+
+
+def test_upsert_many_skips_rows_the_database_rejects(crud_service):
+    """Test that a row failing on insert is skipped without losing the rest of the batch."""
+    taken = crud_service.create("crudtestmodel", name="taken", value=1)
+
+    rows = [
+        {"name": "good", "value": 2, "created_at": "2024-01-01T00:00:00+00:00"},
+        {"id": taken.id, "name": "clash", "value": 3},  # Primary key already in use
+    ]
+    assert crud_service.upsert_many("crudtestmodel", ["name"], rows) == 1
+
+    assert crud_service.read("crudtestmodel", name="good")[0].created_at.year == 2024
+    assert crud_service.read("crudtestmodel", name="clash") == []
+    assert [r.value for r in crud_service.read("crudtestmodel", name="taken")] == [1]
+
+
+def test_update_without_settable_fields_counts_matches(temp_storage):
+    """Test that an update with no model columns to set reports the matches instead of failing."""
+    service = CRUDService(temp_storage, models=[PlainTestModel])
+    try:
+        service.delete("plaintestmodel")
+        service.create("plaintestmodel", name="a")
+        service.create("plaintestmodel", name="a")
+
+        assert service.update("plaintestmodel", {"name": "a"}, {"unknown": 1}) == 2
+    finally:
+        service.stop()
+
+
+def test_nested_calls_share_session(crud_service):
+    """Test that CRUD calls inside a session block reuse it rather than opening their own."""
+    with crud_service._session() as session:
+        crud_service.create("crudtestmodel", name="nested", value=1)
+        with crud_service._session() as inner:
+            assert inner is session
+        records = crud_service.read("crudtestmodel", name="nested")
+        assert all(record in session for record in records)
+
+    assert crud_service._local.session is None
+    assert len(crud_service.read("crudtestmodel", name="nested")) == 1
+
+
+def test_connections_use_wal(crud_service):
+    """Test that PRAGMAS are applied to new connections."""
+    with crud_service.engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+
+
+def test_updated_at_is_indexed(crud_service):
+    """Test that models with updated_at get an index on it."""
+    with crud_service.engine.connect() as conn:
+        indexes = conn.exec_driver_sql("PRAGMA index_list(crudtestmodel)").all()
+    assert "idx_crudtestmodel_updated_at" in [index[1] for index in indexes]
+
+
 def test_model_attribute_access(crud_service):
     """Test that models are accessible as attributes."""
     assert hasattr(crud_service, "crudtestmodel")
@@ -177,6 +297,12 @@ def test_invalid_model_name(crud_service):
     with pytest.raises(ValueError, match="Unknown model: nonexistent"):
         crud_service.upsert("nonexistent", [])
 
+    with pytest.raises(ValueError, match="Unknown model: nonexistent"):
+        crud_service.upsert_many("nonexistent", [], [])
+
+    with pytest.raises(ValueError, match="Unknown model: nonexistent"):
+        crud_service.count_distinct("nonexistent", "id")
+
 
 def test_get_records_since_no_updated_at():
     """Test error when model doesn't have updated_at field."""
@@ -3,7 +3,7 @@
 import pytest
 import asyncio
 
-from vldmcp.service.decorator import expose, share, set_context, get_context, clear_context
+from vldmcp.service.decorator import expose, share, set_context, get_context, clear_context, context_scope
 
 
 @pytest.fixture(autouse=True)
@@ -174,6 +174,18 @@ def test_get_context_function():
     assert context.metadata == {"user": "test", "timestamp": 12345, "action": "test_action"}
 
 
+def test_context_scope_leaves_outer_metadata():
+    """Test that metadata set inside a scope doesn't leak into the enclosing context."""
+
+    async def run_test():
+        set_context(user="outer")
+        async with context_scope(role="inner") as scoped:
+            assert scoped.metadata == {"user": "outer", "role": "inner"}
+        assert get_context().metadata == {"user": "outer"}
+
+    asyncio.run(run_test())
+
+
 def test_no_context_parameter():
     """Test methods without context parameter don't get it injected."""
 
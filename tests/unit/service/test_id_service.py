@@ -5,6 +5,8 @@ from datetime import datetime, UTC, timedelta
 from tempfile import TemporaryDirectory
 from pathlib import Path
 
+from sqlalchemy import event
+
 from vldmcp.service.claim import ClaimService
 from vldmcp.service.system.storage import Storage
 
@@ -163,6 +165,29 @@ def test_has_conflicts(id_service):
     assert id_service.has_conflicts("github", "username")
 
 
+def test_has_conflicts_ignores_blank_claimants(id_service):
+    """Test that claims with an empty or missing claimant don't count as a second claimer."""
+    id_service.create_identity_claim(123, "github", "username", 456, "sig1", "key1")
+    id_service.create_identity_claim(789, "github", "username", "", "sig2", "key2")
+    id_service.create_identity_claim(790, "github", "username", None, "sig3", "key3")
+
+    assert not id_service.has_conflicts("github", "username")
+
+
+def test_get_identity_claims_uses_index(id_service):
+    """Test that identity lookups are filtered in SQLite through the identity index."""
+    id_service.create_identity_claim(123, "github", "user1", 456, "sig1", "key1")
+    statements = []
+    event.listen(id_service.engine, "before_cursor_execute", lambda *args: statements.append(args[2:4]))
+
+    assert len(id_service.get_identity_claims(123)) == 1
+
+    statement, params = statements[-1]
+    with id_service.engine.connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", params).all()
+    assert "idx_claim_identity" in plan[0][-1]
+
+
 def test_get_identity_summary(id_service):
     """Test getting identity summary."""
     # Create various claims for identity 123
@@ -183,7 +208,7 @@ def test_get_identity_summary(id_service):
     assert summary["verified_claims"] == 1
     assert set(summary["providers"]) == {"github", "email", "veilid"}
     assert len(summary["claims_by_provider"]) == 3
-    assert "github:user123" in summary["conflicts"]
+    assert summary["conflicts"] == {"github:user123": [456, 999]}
 
 
 def test_register_machine(id_service):
@@ -0,0 +1,25 @@
+"""Tests for the direct server entry point."""
+
+import signal
+import subprocess
+import sys
+import time
+
+from vldmcp.util.paths import Paths
+
+
+def test_server_removes_pid_file_on_sigterm(xdg_dirs):
+    """Test that SIGTERM shuts the server down through its cleanup path."""
+    pid_file = Paths.RUNTIME / "vldmcp.pid"
+    proc = subprocess.Popen([sys.executable, "-m", "vldmcp.server"], stdout=subprocess.DEVNULL)
+
+    for _ in range(100):
+        if pid_file.exists() and pid_file.read_text():
+            break
+        time.sleep(0.1)
+    assert pid_file.read_text() == str(proc.pid)
+
+    proc.send_signal(signal.SIGTERM)
+
+    assert proc.wait(timeout=10) == 0
+    assert not pid_file.exists()
@@ -0,0 +1,64 @@
+"""Tests for disk usage utilities."""
+
+import os
+import subprocess
+
+from vldmcp.util.disk import get_dir_size, get_dir_sizes, get_total_size
+
+
+def test_get_dir_size_missing_path(tmp_path):
+    """Test that a missing directory has zero size."""
+    assert get_dir_size(tmp_path / "missing") == 0
+
+
+def test_get_dir_size_matches_du(tmp_path):
+    """Test that the walked size matches `du -sb` for a nested tree."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "top.txt").write_bytes(b"x" * 100)
+    (tmp_path / "a" / "mid.txt").write_bytes(b"x" * 2000)
+    (tmp_path / "a" / "b" / "deep.txt").write_bytes(b"x" * 30000)
+    os.symlink(tmp_path / "a", tmp_path / "link")
+
+    du_output = subprocess.run(["du", "-sb", str(tmp_path)], capture_output=True, text=True, check=True).stdout
+
+    assert get_dir_size(tmp_path) == int(du_output.split()[0])
+
+
+def test_get_dir_sizes_nested_paths(tmp_path):
+    """Test that nested paths measured in one walk match measuring each separately."""
+    (tmp_path / "data" / "install" / "base").mkdir(parents=True)
+    (tmp_path / "data" / "www").mkdir()
+    (tmp_path / "config").mkdir()
+    (tmp_path / "data" / "db").write_bytes(b"x" * 100)
+    (tmp_path / "data" / "install" / "base" / "image").write_bytes(b"x" * 2000)
+    (tmp_path / "data" / "www" / "index.html").write_bytes(b"x" * 30000)
+    (tmp_path / "config" / "config.toml").write_bytes(b"x" * 400)
+    paths = [
+        tmp_path / "config",
+        tmp_path / "data" / "install" / "base",
+        tmp_path / "data",
+        tmp_path / "data" / "www",
+        tmp_path / "missing",
+    ]
+
+    assert get_dir_sizes(paths) == [get_dir_size(p) for p in paths]
+
+
+def test_get_dir_sizes_repeated_paths(tmp_path):
+    """Test that a path given twice is measured once and reported in both places."""
+    (tmp_path / "state").mkdir()
+    (tmp_path / "state" / "log").write_bytes(b"x" * 500)
+    paths = [tmp_path, tmp_path / "state", tmp_path]
+
+    assert get_dir_sizes(paths) == [get_dir_size(tmp_path), get_dir_size(tmp_path / "state"), get_dir_size(tmp_path)]
+
+
+def test_get_total_size_counts_nested_paths_once(tmp_path):
+    """Test that a path nested inside another adds nothing to the total."""
+    (tmp_path / "outer" / "inner").mkdir(parents=True)
+    (tmp_path / "outer" / "inner" / "blob").write_bytes(b"x" * 700)
+    (tmp_path / "other").mkdir()
+    (tmp_path / "other" / "blob").write_bytes(b"x" * 50)
+    paths = [tmp_path / "outer" / "inner", tmp_path / "outer", tmp_path / "other", tmp_path / "outer"]
+
+    assert get_total_size(paths) == get_dir_size(tmp_path / "outer") + get_dir_size(tmp_path / "other")
@@ -0,0 +1,24 @@
+"""Tests for XDG path resolution."""
+
+from vldmcp.util.paths import Paths
+
+
+def test_paths_follow_xdg_environment(xdg_dirs):
+    """Test that paths are derived from the XDG environment variables."""
+    assert Paths.DATA == xdg_dirs / "data" / "vldmcp"
+    assert Paths.KEYS == xdg_dirs / "data" / "vldmcp" / "keys"
+    assert Paths.NODES == xdg_dirs / "state" / "vldmcp" / "nodes"
+    assert Paths.REPOS == xdg_dirs / "cache" / "vldmcp" / "src"
+    assert Paths.RUNTIME == xdg_dirs / "runtime" / "vldmcp"
+
+
+def test_paths_pick_up_environment_changes(xdg_dirs, monkeypatch):
+    """Test that changing an XDG variable changes the derived paths."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(xdg_dirs / "other"))
+
+    assert Paths.CONFIG == xdg_dirs / "other" / "vldmcp"
+
+
+def test_paths_are_reused_for_same_environment(xdg_dirs):
+    """Test that repeated lookups return the same precomputed Path."""
+    assert Paths.INSTALL is Paths.INSTALL
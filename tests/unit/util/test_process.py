@@ -0,0 +1,76 @@
+"""Tests for process utilities."""
+
+import os
+import signal
+import subprocess
+import sys
+
+from vldmcp.util import process
+from vldmcp.util.process import (
+    is_process_running,
+    kill_process_from_pidfile,
+    kill_process_gracefully,
+    read_pid_file,
+    write_pid_file,
+)
+
+
+def test_is_process_running_current_process():
+    """Test that our own process is reported as running."""
+    assert is_process_running(os.getpid())
+
+
+def test_is_process_running_missing_process():
+    """Test that a PID beyond pid_max is reported as not running."""
+    assert not is_process_running(99999999)
+
+
+def test_is_process_running_without_proc(monkeypatch):
+    """Test the kill(pid, 0) probe used where /proc is unavailable."""
+    monkeypatch.setattr(process, "_HAS_PROC", False)
+
+    assert is_process_running(os.getpid())
+    assert not is_process_running(99999999)
+
+
+def test_kill_process_gracefully_escalates_to_sigkill():
+    """Test that a process ignoring SIGTERM is killed with SIGKILL after the timeout."""
+    code = "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); print(flush=True); time.sleep(30)"
+    proc = subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE)
+    proc.stdout.readline()  # Handler is installed once it prints
+
+    assert kill_process_gracefully(proc.pid, timeout=1)
+    assert proc.wait(timeout=5) == -signal.SIGKILL
+
+
+def test_kill_process_gracefully_missing_process():
+    """Test that killing a missing process reports it didn't exist."""
+    assert not kill_process_gracefully(99999999)
+
+
+def test_write_pid_file_replaces_contents(tmp_path):
+    """Test that the PID file is replaced whole and no temp file is left behind."""
+    pid_file = tmp_path / "vldmcp.pid"
+    pid_file.write_text("123456")
+
+    write_pid_file(pid_file, 42)
+
+    assert pid_file.read_text() == "42"
+    assert [p.name for p in tmp_path.iterdir()] == ["vldmcp.pid"]
+
+
+def test_kill_process_from_missing_pidfile(tmp_path):
+    """Test that a missing PID file counts as nothing to kill."""
+    assert kill_process_from_pidfile(tmp_path / "missing.pid")
+
+
+def test_read_pid_file(tmp_path):
+    """Test that a PID file's contents are read stripped, and missing or empty files give None."""
+    pid_file = tmp_path / "vldmcp.pid"
+    assert read_pid_file(pid_file) is None
+
+    pid_file.write_text("")
+    assert read_pid_file(pid_file) is None
+
+    pid_file.write_text("42\n")
+    assert read_pid_file(pid_file) == "42"